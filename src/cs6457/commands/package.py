@@ -1,12 +1,21 @@
 import click
+import functools
+import os
 import zipfile
+import zlib
 import re
+import stat
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 from importlib.resources import files
 
 # === Constants ===
 
 README_PATTERN = re.compile(r"^[A-Za-z]+_[A-Za-z]_m\d+_readme\.txt$")
+README_SUFFIX = "_readme.txt"
 REQUIRED_DIRS = [
     "Build", 
     "Assets", 
@@ -14,71 +23,481 @@ REQUIRED_DIRS = [
     "Packages"
 ]
 
+# Assets that are already compressed (or gain next to nothing from it) are stored as-is.
+STORED_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg",
+    ".ogg", ".mp3", ".wav",
+    ".mp4", ".webm",
+    ".unity3d", ".assetbundle", ".fbx",
+    ".br", ".gz", ".zip",
+})
+
+# Reused for every file copied by the main process.
+_COPY_BUFFER = bytearray(1 << 20)
+
+# Larger files are streamed by the main process instead of being read whole by a worker.
+PARALLEL_MAX_FILE_SIZE = 64 * 1024 * 1024
+# Below this, pickling and the round trip to a worker cost more than deflating inline.
+PARALLEL_MIN_FILE_SIZE = 256 * 1024
+
+# Name -> (zipfile compression constant, default level, accepted level range). Deflate
+# defaults to level 1 for speed; pass --compress-level 6 (zlib's default) for smaller
+# archives. A range of None means the method takes no level.
+COMPRESSION_METHODS = {
+    "deflate": (zipfile.ZIP_DEFLATED, 1, (0, 9)),
+    "bzip2": (zipfile.ZIP_BZIP2, 9, (1, 9)),
+    "lzma": (zipfile.ZIP_LZMA, None, None),
+    "store": (zipfile.ZIP_STORED, None, None),
+}
+if hasattr(zipfile, "ZIP_ZSTANDARD"):  # Python 3.14+
+    COMPRESSION_METHODS["zstd"] = (zipfile.ZIP_ZSTANDARD, 3, (1, 22))
+
 # === Project Validation ===
 
+def is_readme_name(name: str) -> bool:
+    # Most names in a project root fail the C-level suffix test and never reach the regex.
+    return name.endswith(README_SUFFIX) and README_PATTERN.match(name) is not None
+
 def find_valid_readme(directory: Path) -> Path | None:
-    for file in directory.iterdir():
-        if file.is_file() and README_PATTERN.fullmatch(file.name):
-            return file
+    # DirEntry caches the file type from the directory listing, so no stat per entry.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if is_readme_name(entry.name) and entry.is_file():
+                return Path(entry.path)
     return None
 
-def validate_project_structure(project_path: Path):
-    missing_dirs = [d for d in REQUIRED_DIRS if not (project_path / d).is_dir()]
+def scan_project_root(project_path: Path | str) -> tuple[dict[str, str], Path | None]:
+    """List the project root once, returning the required directories found and the readme.
+
+    The directory map goes from each ``REQUIRED_DIRS`` spelling to the name as it
+    appears on disk. A differently-cased folder such as ``build`` only counts when
+    the filesystem itself resolves ``Build`` to it (Windows, default macOS volumes).
+    """
+    present_dirs, readme = {}, None
+    with os.scandir(project_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                present_dirs[entry.name] = entry.name
+            elif readme is None and is_readme_name(entry.name) and entry.is_file():
+                readme = Path(entry.path)
+
+    folded = {name.casefold(): name for name in present_dirs}
+    found = {}
+    for d in REQUIRED_DIRS:
+        if d in present_dirs:
+            found[d] = d
+        elif (name := folded.get(d.casefold())) and os.path.isdir(os.path.join(project_path, d)):
+            found[d] = name
+    return found, readme
+
+def validate_project_structure(project_path: Path) -> Path:
+    """Check the project layout and return its readme, listing the root only once."""
+    present_dirs, readme = scan_project_root(project_path)
+
+    missing_dirs = [d for d in REQUIRED_DIRS if d not in present_dirs]
     if missing_dirs:
         raise click.ClickException(
             f"\nMissing required directories:\n  - " + "\n  - ".join(missing_dirs)
         )
 
-    readme = find_valid_readme(project_path)
     if not readme:
         raise click.ClickException(
             "\nMissing or incorrectly named readme file.\nExpected format: <LASTNAME>_<FIRST_INITIAL>_m<INT>_readme.txt"
         )
+    return readme
+
+# === Excludes ===
+
+# Windows paths compare case-insensitively, as PureWindowsPath.match does.
+_IGNORE_CASE = os.name == "nt"
+
+def normalize_excludes(patterns) -> tuple[str, ...]:
+    """Strip whitespace and drop blank or repeated patterns, keeping first-seen order."""
+    return tuple(dict.fromkeys(p for pattern in patterns if (p := pattern.strip())))
+
+def split_excludes(patterns: list[str]) -> tuple[list[str], list[str]]:
+    """Split patterns into those that can prune whole directories and those checked per file.
+
+    ``Library/**`` prunes the ``Library`` directory outright, and a gitignore-style
+    ``Logs/`` only ever names a directory. A pattern whose last component is a plain
+    name such as ``Temp`` or ``**/Temp`` may refer to either a directory or a file,
+    so it lands in both lists.
+    """
+    dir_patterns, file_patterns = [], []
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            if pattern := pattern.rstrip("/"):
+                dir_patterns.append(pattern)
+        elif pattern.endswith("/**"):
+            dir_patterns.append(pattern[:-3])
+        elif not any(c in pattern.rsplit("/", 1)[-1] for c in "*?["):
+            dir_patterns.append(pattern)
+            file_patterns.append(pattern)
+        else:
+            file_patterns.append(pattern)
+    return dir_patterns, file_patterns
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a glob into a regex fragment where ``*`` stops at ``/`` and ``**`` recurses."""
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            parts.append("(?:/.*)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        else:
+            c = pattern[i]
+            i += 1
+            if c == "*":
+                parts.append("[^/]*")
+            elif c == "?":
+                parts.append("[^/]")
+            elif c == "[":
+                bracket, i = _translate_bracket(pattern, i)
+                parts.append(bracket)
+            else:
+                parts.append(re.escape(c))
+    return "".join(parts)
+
+def _translate_bracket(pattern: str, i: int) -> tuple[str, int]:
+    """Translate the bracket expression whose body starts at ``pattern[i]``.
+
+    Follows ``fnmatch.translate``: a leading ``!`` negates, a ``]`` right after the
+    opening bracket is literal, empty ranges such as ``z-a`` are dropped, and
+    characters with special meaning in a regex class are escaped. Negated classes
+    never match ``/``. Returns the regex and the index just past the expression.
+    """
+    j = i
+    if j < len(pattern) and pattern[j] == "!":
+        j += 1
+    if j < len(pattern) and pattern[j] == "]":
+        j += 1
+    j = pattern.find("]", j)
+    if j == -1:
+        return "\\[", i
+
+    negate = pattern[i] == "!"
+    start = i + 1 if negate else i
+    # Split the body on range hyphens so each range can be checked and escaped.
+    chunks, k = [], start + 1
+    while (k := pattern.find("-", k, j)) != -1:
+        chunks.append(pattern[start:k])
+        start, k = k + 1, k + 3
+    if chunk := pattern[start:j]:
+        chunks.append(chunk)
+    elif chunks:
+        chunks[-1] += "-"
+    else:
+        chunks.append("")
+    # Drop empty ranges; they are invalid in a regex.
+    for k in range(len(chunks) - 1, 0, -1):
+        if chunks[k - 1][-1] > chunks[k][0]:
+            chunks[k - 1] = chunks[k - 1][:-1] + chunks[k][1:]
+            del chunks[k]
+    body = "-".join(c.replace("\\", "\\\\").replace("-", "\\-") for c in chunks)
+    # A literal "]" can only lead the body; escape it since "/" may be prepended below.
+    body = re.sub(r"([&~|\]])", r"\\\1", body)
+
+    if negate:
+        return ("[^/]" if not body else f"[^/{body}]"), j + 1
+    if not body:
+        return "(?!)", j + 1
+    if body[0] in "^[":
+        body = "\\" + body
+    return f"[{body}]", j + 1
+
+class ExcludeMatcher(NamedTuple):
+    """Compiled excludes: O(1) set lookups for the common pattern shapes, regex for the rest."""
+    suffixes: frozenset[str]  # "*.meta" -> "meta"
+    names: frozenset[str]  # ".DS_Store", "Temp": compared against the last path component
+    regex: re.Pattern | None  # everything else, as one alternation
+
+@functools.lru_cache(maxsize=None)
+def _compile_excludes(patterns: tuple[str, ...]) -> ExcludeMatcher:
+    """Compile glob patterns into a matcher for POSIX relative paths.
+
+    Like ``PurePath.match``, a pattern is anchored to the end of the path and may
+    start at any component boundary, and matching ignores case on Windows.
+    """
+    suffixes, names, globs = set(), set(), []
+    for pattern in patterns:
+        if _IGNORE_CASE:
+            pattern = pattern.casefold()
+        # Matches may already start at any component, so a leading "**/" adds nothing.
+        while pattern.startswith("**/"):
+            pattern = pattern[3:]
+        ext = pattern[2:]
+        if pattern.startswith("*.") and ext and not any(c in ext for c in "*?[./"):
+            suffixes.add(ext)
+        elif not any(c in pattern for c in "*?[/"):
+            names.add(pattern)
+        else:
+            globs.append(pattern)
+
+    regex = None
+    if globs:
+        # "Temp/**/x" and "**/Temp/**/x" reduce to the same glob; keep one copy.
+        alternation = "|".join(_glob_to_regex(p) for p in dict.fromkeys(globs))
+        flags = re.DOTALL | (re.IGNORECASE if _IGNORE_CASE else 0)
+        try:
+            regex = re.compile(rf"(?:^|/)(?:{alternation})\Z", flags)
+        except re.error as e:
+            raise click.BadParameter(f"invalid exclude pattern: {e}", param_hint="'--exclude'") from e
+    return ExcludeMatcher(frozenset(suffixes), frozenset(names), regex)
+
+def should_exclude(path: str, matcher: ExcludeMatcher) -> bool:
+    name = path[path.rfind("/") + 1:]
+    if _IGNORE_CASE:
+        name = name.casefold()
+    dot = name.rfind(".")
+    if dot != -1 and name[dot + 1:] in matcher.suffixes:
+        return True
+    if name in matcher.names:
+        return True
+    return matcher.regex is not None and matcher.regex.search(path) is not None
+
+def _read_default_excludes() -> tuple[str, ...]:
+    # Filter on bytes and decode only the surviving patterns, not the whole file.
+    raw = files("cs6457.resources").joinpath("package_default_exclusions.txt").read_bytes()
+    return normalize_excludes(p.decode("utf-8") for line in raw.split(b"\n") if (p := line.strip()) and not p.startswith(b"#"))
+
+# Loaded once at import rather than on every invocation.
+_DEFAULT_EXCLUDES = _read_default_excludes()
+# Warm the _compile_excludes cache so package_to_zip finds the default matchers already built.
+for _patterns in split_excludes(_DEFAULT_EXCLUDES):
+    _compile_excludes(tuple(_patterns))
+del _patterns
+
+def load_default_excludes() -> tuple[str, ...]:
+    return _DEFAULT_EXCLUDES
+
+# === Verbose Output ===
+
+class VerboseLog:
+    """Per-file verbose lines, written to stdout in batches.
 
-# === Exclude Loading ===
+    Styling every line through click.secho is noticeable on projects with tens of
+    thousands of files, so the styled prefixes are built once and lines are joined
+    into a single click.echo every ``batch_size`` entries. click still strips the
+    colors when stdout is not a terminal and handles Windows consoles.
+    """
 
-def load_default_excludes() -> list[str]:
-    resource_file = files("cs6457.resources").joinpath("default_exclude.txt")
-    return [
-        line.strip()
-        for line in resource_file.read_text(encoding="utf-8").splitlines()
-        if line.strip() and not line.startswith("#")
-    ]
+    def __init__(self, batch_size: int = 512):
+        self._added = click.style("[+] Added: ", fg="green", reset=False)
+        self._skipped = click.style("[-] Skipped (excluded): ", fg="yellow", reset=False)
+        self._end = click.style("") + "\n"
+        self._batch_size = batch_size
+        self._lines = []
+
+    def added(self, rel: str) -> None:
+        self._append(self._added + rel + self._end)
+
+    def skipped(self, rel: str) -> None:
+        self._append(self._skipped + rel + self._end)
+
+    def _append(self, line: str) -> None:
+        self._lines.append(line)
+        if len(self._lines) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            click.echo("".join(self._lines), nl=False)
+            self._lines.clear()
 
 # === Zipping Logic ===
 
-def package_to_zip(base_path: Path, output_zip: Path, excludes: list[str], verbose: bool = False) -> None:
+def package_to_zip(
+    base_path: Path,
+    output_zip: Path,
+    excludes: list[str],
+    verbose: bool = False,
+    compression: int = zipfile.ZIP_DEFLATED,
+    compress_level: int | None = 1,
+    jobs: int = 1,
+    readme_file: Path | None = None,
+) -> None:
     base_path = base_path.resolve()
-    readme_file = find_valid_readme(base_path)
-
-    with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # === Include README ===
-        if readme_file:
-            rel_path = readme_file.relative_to(base_path)
-            if not should_exclude(rel_path, excludes):
-                zipf.write(readme_file, arcname=rel_path)
-                click.secho(f"[+] Added README: {rel_path}", fg="green", color=True)
-
-        # === Include files from required directories ===
-        for folder_name in REQUIRED_DIRS:
-            folder_path = base_path / folder_name
-            if not folder_path.exists():
-                continue
-
-            for file in folder_path.rglob("*"):
-                if file.is_file():
-                    rel_path = file.relative_to(base_path)
-                    if should_exclude(rel_path, excludes):
-                        if verbose:
-                            click.secho(f"[-] Skipped (excluded): {rel_path}", fg="yellow", color=True)
-                    else:
-                        zipf.write(file, arcname=rel_path)
-                        if verbose:
-                            click.secho(f"[+] Added: {rel_path}", fg="green", color=True)
-
-def should_exclude(path: Path, patterns: list[str]) -> bool:
-    path_str = path.as_posix()
-    return any(path.match(pattern) for pattern in patterns)
+    if readme_file is None:
+        readme_file = find_valid_readme(base_path)
+    base_prefix = str(base_path) + os.sep
+
+    # Deduplicated patterns give a smaller regex and a stable _compile_excludes cache key.
+    dir_patterns, file_patterns = split_excludes(normalize_excludes(excludes))
+    dir_matcher = _compile_excludes(tuple(dir_patterns))
+    file_matcher = _compile_excludes(tuple(file_patterns))
+
+    # Deflate is the only method zlib can run in worker processes; the rest stay serial.
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and compression == zipfile.ZIP_DEFLATED else None
+    pending = deque()
+    log = VerboseLog() if verbose else None
+    try:
+        with zipfile.ZipFile(
+            output_zip, 'w', compression,
+            allowZip64=True,
+            compresslevel=compress_level,
+            strict_timestamps=False,
+        ) as zipf:
+            # === Include README ===
+            if readme_file:
+                rel = readme_file.name
+                if not should_exclude(rel, file_matcher):
+                    path = base_prefix + rel
+                    _write_streamed(zipf, path, _zipinfo_for(rel, os.stat(path), compression))
+                    click.secho(f"[+] Added README: {rel}", fg="green", color=True)
+
+            # === Include files from required directories ===
+            for path, rel in iter_project_files(base_prefix, dir_matcher, file_matcher, log):
+                # One stat per file, shared by the regular-file check, the size check and
+                # the entry header. Dangling symlinks, FIFOs and sockets are skipped.
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                zinfo = _zipinfo_for(rel, st, entry_compression(rel, compression))
+                if (
+                    pool
+                    and zinfo.compress_type == zipfile.ZIP_DEFLATED
+                    and PARALLEL_MIN_FILE_SIZE <= zinfo.file_size <= PARALLEL_MAX_FILE_SIZE
+                ):
+                    pending.append(pool.submit(_deflate_file, path, zinfo, compress_level))
+                    # Bound memory to a few in-flight buffers per worker.
+                    if len(pending) >= jobs * 2:
+                        _write_deflated(zipf, *pending.popleft().result())
+                else:
+                    _write_streamed(zipf, path, zinfo)
+                if log:
+                    log.added(rel)
+
+            while pending:
+                _write_deflated(zipf, *pending.popleft().result())
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+        if log:
+            log.flush()
+
+def iter_project_files(
+    base_prefix: str,
+    dir_matcher: ExcludeMatcher,
+    file_matcher: ExcludeMatcher,
+    log: VerboseLog | None = None,
+):
+    """Yield ``(path, arcname)`` for every non-excluded file under the required directories.
+
+    The project root is listed once and only the required directories present there
+    are walked, each at most once, with arcnames under the ``REQUIRED_DIRS`` spelling. Excluded directories, including a required
+    directory itself, are pruned from ``os.walk`` before it descends into them.
+    Arcnames are derived once per directory by string slicing; no Path objects per entry.
+    """
+    # Same case rule as validation; walk the on-disk name, archive under the canonical one.
+    present, _ = scan_project_root(base_prefix)
+
+    for folder_name, disk_name in present.items():
+        if should_exclude(folder_name, dir_matcher):
+            if log:
+                log.skipped(folder_name + "/")
+            continue
+
+        # Every dirpath from os.walk starts with root, so slicing it off is enough.
+        root = base_prefix + disk_name
+        root_len = len(root)
+        for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
+            rel_dir = folder_name + dirpath[root_len:]
+            if os.sep != "/":
+                rel_dir = rel_dir.replace(os.sep, "/")
+
+            # Each directory is judged exactly once, here, before os.walk enters it. Files
+            # below a kept directory are only tested against file patterns, so there is
+            # no repeated parent-prefix work to cache.
+            kept = []
+            for name in dirnames:
+                rel = f"{rel_dir}/{name}"
+                if should_exclude(rel, dir_matcher):
+                    if log:
+                        log.skipped(rel + "/")
+                else:
+                    kept.append(name)
+            dirnames[:] = kept
+
+            for name in filenames:
+                rel = f"{rel_dir}/{name}"
+                if should_exclude(rel, file_matcher):
+                    if log:
+                        log.skipped(rel)
+                else:
+                    yield f"{dirpath}{os.sep}{name}", rel
+
+def _zipinfo_for(arcname: str, st: os.stat_result, compress_type: int) -> zipfile.ZipInfo:
+    """Build an entry header from an existing stat result, like ZipInfo.from_file without the stat.
+
+    Timestamps outside the range ZIP can store are clamped, as with strict_timestamps=False.
+    """
+    date_time = time.localtime(st.st_mtime)[:6]
+    if date_time[0] < 1980:
+        date_time = (1980, 1, 1, 0, 0, 0)
+    elif date_time[0] > 2107:
+        date_time = (2107, 12, 31, 23, 59, 59)
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.create_system = 3  # Unix: external_attr always carries st_mode bits
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    zinfo.compress_type = compress_type
+    return zinfo
+
+def _write_streamed(zipf: zipfile.ZipFile, path: str, zinfo: zipfile.ZipInfo) -> None:
+    """Copy one file into the archive through a shared 1 MiB buffer.
+
+    ZipFile.write copies in small chunks; reusing one large buffer cuts the number of
+    read/compress/write round trips on big assets without allocating per file.
+    """
+    zinfo._compresslevel = zipf.compresslevel
+    view = memoryview(_COPY_BUFFER)
+    with open(path, "rb", buffering=0) as src, zipf.open(zinfo, "w") as dst:
+        while n := src.readinto(_COPY_BUFFER):
+            dst.write(view[:n])
+
+def _deflate_file(path: str, zinfo: zipfile.ZipInfo, level: int | None) -> tuple[zipfile.ZipInfo, bytes]:
+    """Worker: compress one file to a raw deflate stream and complete its ZipInfo."""
+    with open(path, "rb") as f:
+        data = f.read()
+    compressor = zlib.compressobj(-1 if level is None else level, zlib.DEFLATED, -15)
+    blob = compressor.compress(data) + compressor.flush()
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(blob)
+    zinfo.CRC = zlib.crc32(data)
+    return zinfo, blob
+
+def _write_deflated(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, blob: bytes) -> None:
+    """Append an already-deflated entry, mirroring what ZipFile.open(..., 'w') does on close.
+
+    zipfile has no public API for pre-compressed data, so this writes the local header
+    and payload directly and registers the entry for the central directory.
+    """
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+    zipf.fp.seek(zipf.start_dir)
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._writecheck(zinfo)
+    zipf._didModify = True
+    zipf.fp.write(zinfo.FileHeader(zip64))
+    zipf.fp.write(blob)
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+def entry_compression(arcname: str, compression: int) -> int:
+    """Pick the compression for one entry, storing already-compressed formats uncompressed."""
+    dot = arcname.rfind(".")
+    ext = arcname[dot:].lower() if dot > arcname.rfind("/") else ""
+    return zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else compression
 
 # === CLI ===
 
@@ -99,22 +518,49 @@ def should_exclude(path: Path, patterns: list[str]) -> bool:
     type=click.Path(writable=True, dir_okay=False, path_type=Path),
     help="Output zip file name. If not specified, one is generated from the readme name."
 )
+@click.option(
+    "-c", "--compression",
+    type=click.Choice(list(COMPRESSION_METHODS)),
+    default="deflate",
+    show_default=True,
+    help="Compression method for archive entries."
+)
+@click.option(
+    "-l", "--compress-level",
+    type=int,
+    default=None,
+    help="Compression level (deflate: 0-9, default 1 for speed, 6 for smaller output; bzip2: 1-9; zstd: 1-22). Ignored by lzma and store."
+)
+@click.option(
+    "-j", "--jobs",
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default=True,
+    help="Number of worker processes used for deflate compression (1 disables parallelism)."
+)
 @click.option(
     "-v", "--verbose",
     is_flag=True,
     default=False,
     help="Enable verbose output for file inclusion and exclusion."
 )
-def package(path: Path, exclude: list[str], output: Path, verbose: bool):
+def package(path: Path, exclude: list[str], output: Path, compression: str, compress_level: int | None, jobs: int, verbose: bool):
     """Package a Unity project into a zip archive, validating structure and excluding specified patterns."""
+    compress_type, default_level, level_range = COMPRESSION_METHODS[compression]
+    if level_range is None:
+        compress_level = None
+    elif compress_level is None:
+        compress_level = default_level
+    elif not level_range[0] <= compress_level <= level_range[1]:
+        raise click.BadParameter(
+            f"{compression} accepts levels {level_range[0]}-{level_range[1]}.",
+            param_hint="'--compress-level'",
+        )
+
     click.secho("\n==> Validating project structure...", fg="blue", color=True)
-    validate_project_structure(path)
+    readme_file = validate_project_structure(path)
     click.secho("✓ Project structure is valid.\n", fg="green", color=True)
 
-    readme_file = find_valid_readme(path)
-    if not readme_file:
-        raise click.ClickException("Could not locate valid readme after validation step.")
-
     # === Derive output name from readme if not provided
     if output is None:
         stem = readme_file.stem  # e.g. "Burdell_G_m0_readme"
@@ -123,15 +569,24 @@ def package(path: Path, exclude: list[str], output: Path, verbose: bool):
         else:
             output = Path("package.zip")
 
-    excludes = exclude or load_default_excludes()
-    if not exclude:
+    excludes = normalize_excludes(exclude)
+    if not excludes:
+        excludes = load_default_excludes()
         click.secho("Using default exclusion patterns from resources.\n", fg="yellow", color=True)
 
     click.secho("==> Packaging Info", fg="blue", color=True)
     click.secho(f"  Project Root   : {path}", fg="blue", color=True)
     click.secho(f"  Output Archive : {output}", fg="blue", color=True)
+    click.secho(f"  Compression    : {compression}" + (f" (level {compress_level})" if compress_level is not None else ""), fg="blue", color=True)
     click.secho(f"  Exclusions     : {', '.join(excludes)}\n", fg="yellow", color=True)
 
-    package_to_zip(path, output, excludes, verbose=verbose)
+    package_to_zip(
+        path, output, excludes,
+        verbose=verbose,
+        compression=compress_type,
+        compress_level=compress_level,
+        jobs=jobs,
+        readme_file=readme_file,
+    )
 
     click.secho(f"\n✓ Created archive: {output}", fg="green", bold=True, color=True)